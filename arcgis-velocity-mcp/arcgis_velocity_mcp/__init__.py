@@ -5,5 +5,13 @@ ArcGIS Velocity MCP Server Package
 __version__ = "0.1.0"
 __all__ = ["VelocityClient", "get_config"]
 
-from .velocity_client import VelocityClient
-from .config import get_config
+
+def __getattr__(name):
+    # Import submodules lazily so importing the package stays cheap
+    if name == "VelocityClient":
+        from .velocity_client import VelocityClient
+        return VelocityClient
+    if name == "get_config":
+        from .config import get_config
+        return get_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
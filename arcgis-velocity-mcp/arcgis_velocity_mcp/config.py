@@ -5,10 +5,9 @@ Configuration module for ArcGIS Velocity MCP Server
 import os
 from dataclasses import dataclass
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Whether the .env file has been loaded into the environment yet
+_dotenv_loaded = False
 
 
 @dataclass
@@ -45,6 +44,13 @@ def get_config() -> Config:
     Raises:
         ValueError: If required environment variables are missing
     """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        # Load environment variables from .env file if it exists
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+    
     return Config(
         base_url=os.getenv("VELOCITY_BASE_URL", ""),
         username=os.getenv("VELOCITY_USERNAME", ""),
@@ -6,7 +6,11 @@ This module implements the MCP server for ArcGIS Velocity API.
 
 import asyncio
 import logging
-from typing import Any, Optional
+import sys
+from typing import Any, Awaitable, Callable, Dict, Optional
+import orjson
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import mcp.server.stdio
@@ -14,13 +18,17 @@ import mcp.server.stdio
 from .velocity_client import VelocityClient
 from .config import get_config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create server instance
 server = Server("arcgis-velocity-mcp")
 
+# Shared client, opened once in main() and reused by every tool call
+_client: Optional[VelocityClient] = None
+
+# Why _client couldn't be created (e.g. missing configuration), reported by tool calls
+_client_error: Optional[str] = None
+
 
 def create_velocity_client() -> VelocityClient:
     """Create and return a Velocity API client"""
@@ -33,645 +41,552 @@ def create_velocity_client() -> VelocityClient:
     )
 
 
-# ========== Feed Management Tools ==========
+# ========== Tool Schemas ==========
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools"""
-    return [
-        # Feed Management
-        Tool(
-            name="get_feeds",
-            description="Get all feeds in the Velocity environment",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_feed",
-            description="Get details of a specific feed by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="create_feed",
-            description="Create a new feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_data": {
-                        "type": "object",
-                        "description": "The feed configuration object"
-                    }
-                },
-                "required": ["feed_data"]
-            }
-        ),
-        Tool(
-            name="update_feed",
-            description="Update an existing feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed to update"
-                    },
-                    "feed_data": {
-                        "type": "object",
-                        "description": "The updated feed configuration"
-                    }
-                },
-                "required": ["feed_id", "feed_data"]
-            }
-        ),
-        Tool(
-            name="delete_feed",
-            description="Delete a feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed to delete"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="start_feed",
-            description="Start a feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed to start"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="stop_feed",
-            description="Stop a running feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed to stop"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="get_feed_status",
-            description="Get the status of a specific feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="get_feed_metrics",
-            description="Get metrics for a feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed"
-                    },
-                    "time_interval": {
-                        "type": "string",
-                        "description": "Time interval for metrics (e.g., '300s', '5m')"
-                    }
-                },
-                "required": ["feed_id"]
-            }
-        ),
-        Tool(
-            name="clone_feed",
-            description="Clone an existing feed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "feed_id": {
-                        "type": "string",
-                        "description": "The ID of the feed to clone"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the cloned feed"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Description for the cloned feed"
-                    }
-                },
-                "required": ["feed_id", "name"]
-            }
-        ),
-        
-        # Real-Time Analytics
-        Tool(
-            name="get_realtime_analytics",
-            description="Get all real-time analytics",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_realtime_analytic",
-            description="Get details of a specific real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="create_realtime_analytic",
-            description="Create a new real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_data": {
-                        "type": "object",
-                        "description": "The analytic configuration object"
-                    }
-                },
-                "required": ["analytic_data"]
-            }
-        ),
-        Tool(
-            name="update_realtime_analytic",
-            description="Update an existing real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to update"
-                    },
-                    "analytic_data": {
-                        "type": "object",
-                        "description": "The updated analytic configuration"
-                    }
-                },
-                "required": ["analytic_id", "analytic_data"]
-            }
-        ),
-        Tool(
-            name="delete_realtime_analytic",
-            description="Delete a real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to delete"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="start_realtime_analytic",
-            description="Start a real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to start"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="stop_realtime_analytic",
-            description="Stop a real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to stop"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="get_realtime_analytic_status",
-            description="Get the status of a real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="get_realtime_analytic_metrics",
-            description="Get metrics for a real-time analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic"
-                    },
-                    "time_interval": {
-                        "type": "string",
-                        "description": "Time interval for metrics"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        
-        # Big Data Analytics
-        Tool(
-            name="get_bigdata_analytics",
-            description="Get all big data analytics",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_bigdata_analytic",
-            description="Get details of a specific big data analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="start_bigdata_analytic",
-            description="Start a big data analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to start"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="stop_bigdata_analytic",
-            description="Stop a big data analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic to stop"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        Tool(
-            name="get_bigdata_analytic_status",
-            description="Get the status of a big data analytic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "analytic_id": {
-                        "type": "string",
-                        "description": "The ID of the analytic"
-                    }
-                },
-                "required": ["analytic_id"]
-            }
-        ),
-        
-        # Services
-        Tool(
-            name="get_feature_services",
-            description="Get all feature services",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_feature_service",
-            description="Get details of a specific feature service",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service_id": {
-                        "type": "string",
-                        "description": "The ID of the feature service"
-                    }
-                },
-                "required": ["service_id"]
-            }
-        ),
-        Tool(
-            name="get_stream_services",
-            description="Get all stream services",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_stream_service",
-            description="Get details of a specific stream service",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service_id": {
-                        "type": "string",
-                        "description": "The ID of the stream service"
-                    }
+# Input schema for every tool that takes no arguments. pydantic copies only the
+# top level into each Tool, so the nested "properties" and "required" objects
+# are shared by all of those tools and must not be mutated.
+_EMPTY_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+
+def _id_schema(param: str, description: str) -> Dict[str, Any]:
+    """Build the input schema for a tool taking a single required string ID"""
+    return {
+        "type": "object",
+        "properties": {
+            param: {
+                "type": "string",
+                "description": description
+            }
+        },
+        "required": [param]
+    }
+
+
+def _locale_schema(description: str = "Locale for localized labels") -> Dict[str, Any]:
+    """Build the input schema for a definitions tool with an optional locale"""
+    return {
+        "type": "object",
+        "properties": {
+            "locale": {
+                "type": "string",
+                "description": description
+            }
+        },
+        "required": []
+    }
+
+
+# ========== Tool Definitions ==========
+
+# Built once at import; list_tools hands out the same list on every request
+_TOOLS: list[Tool] = [
+    # Feed Management
+    Tool(
+        name="get_feeds",
+        description="Get all feeds in the Velocity environment",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_feed",
+        description="Get details of a specific feed by ID",
+        inputSchema=_id_schema("feed_id", "The ID of the feed")
+    ),
+    Tool(
+        name="create_feed",
+        description="Create a new feed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "feed_data": {
+                    "type": "object",
+                    "description": "The feed configuration object"
+                }
+            },
+            "required": ["feed_data"]
+        }
+    ),
+    Tool(
+        name="update_feed",
+        description="Update an existing feed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "feed_id": {
+                    "type": "string",
+                    "description": "The ID of the feed to update"
                 },
-                "required": ["service_id"]
-            }
-        ),
-        
-        # Definitions
-        Tool(
-            name="get_feed_types",
-            description="Get all available feed type definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "locale": {
-                        "type": "string",
-                        "description": "Locale for localized labels (e.g., 'en_US')"
-                    }
+                "feed_data": {
+                    "type": "object",
+                    "description": "The updated feed configuration"
+                }
+            },
+            "required": ["feed_id", "feed_data"]
+        }
+    ),
+    Tool(
+        name="delete_feed",
+        description="Delete a feed",
+        inputSchema=_id_schema("feed_id", "The ID of the feed to delete")
+    ),
+    Tool(
+        name="start_feed",
+        description="Start a feed",
+        inputSchema=_id_schema("feed_id", "The ID of the feed to start")
+    ),
+    Tool(
+        name="stop_feed",
+        description="Stop a running feed",
+        inputSchema=_id_schema("feed_id", "The ID of the feed to stop")
+    ),
+    Tool(
+        name="get_feed_status",
+        description="Get the status of a specific feed",
+        inputSchema=_id_schema("feed_id", "The ID of the feed")
+    ),
+    Tool(
+        name="get_feed_metrics",
+        description="Get metrics for a feed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "feed_id": {
+                    "type": "string",
+                    "description": "The ID of the feed"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_tool_definitions",
-            description="Get all available tool definitions for analytics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "locale": {
-                        "type": "string",
-                        "description": "Locale for localized labels"
-                    }
+                "time_interval": {
+                    "type": "string",
+                    "description": "Time interval for metrics (e.g., '300s', '5m')"
+                }
+            },
+            "required": ["feed_id"]
+        }
+    ),
+    Tool(
+        name="clone_feed",
+        description="Clone an existing feed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "feed_id": {
+                    "type": "string",
+                    "description": "The ID of the feed to clone"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_output_definitions",
-            description="Get all available output definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "locale": {
-                        "type": "string",
-                        "description": "Locale for localized labels"
-                    }
+                "name": {
+                    "type": "string",
+                    "description": "Name for the cloned feed"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_source_definitions",
-            description="Get all available source definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "locale": {
-                        "type": "string",
-                        "description": "Locale for localized labels"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Description for the cloned feed"
+                }
+            },
+            "required": ["feed_id", "name"]
+        }
+    ),
+    
+    # Real-Time Analytics
+    Tool(
+        name="get_realtime_analytics",
+        description="Get all real-time analytics",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_realtime_analytic",
+        description="Get details of a specific real-time analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic")
+    ),
+    Tool(
+        name="create_realtime_analytic",
+        description="Create a new real-time analytic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "analytic_data": {
+                    "type": "object",
+                    "description": "The analytic configuration object"
+                }
+            },
+            "required": ["analytic_data"]
+        }
+    ),
+    Tool(
+        name="update_realtime_analytic",
+        description="Update an existing real-time analytic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "analytic_id": {
+                    "type": "string",
+                    "description": "The ID of the analytic to update"
                 },
-                "required": []
-            }
-        ),
-        
-        # System
-        Tool(
-            name="get_version",
-            description="Get the Velocity API version",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="query_logs",
-            description="Query system logs with various filters",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query_params": {
-                        "type": "object",
-                        "description": "Query parameters for filtering logs"
-                    }
+                "analytic_data": {
+                    "type": "object",
+                    "description": "The updated analytic configuration"
+                }
+            },
+            "required": ["analytic_id", "analytic_data"]
+        }
+    ),
+    Tool(
+        name="delete_realtime_analytic",
+        description="Delete a real-time analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic to delete")
+    ),
+    Tool(
+        name="start_realtime_analytic",
+        description="Start a real-time analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic to start")
+    ),
+    Tool(
+        name="stop_realtime_analytic",
+        description="Stop a real-time analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic to stop")
+    ),
+    Tool(
+        name="get_realtime_analytic_status",
+        description="Get the status of a real-time analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic")
+    ),
+    Tool(
+        name="get_realtime_analytic_metrics",
+        description="Get metrics for a real-time analytic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "analytic_id": {
+                    "type": "string",
+                    "description": "The ID of the analytic"
                 },
-                "required": ["query_params"]
-            }
-        ),
-        Tool(
-            name="export_configuration",
-            description="Export a snapshot of the current configuration",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_tenant_metrics",
-            description="Get tenant-level metrics summary",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-    ]
+                "time_interval": {
+                    "type": "string",
+                    "description": "Time interval for metrics"
+                }
+            },
+            "required": ["analytic_id"]
+        }
+    ),
+    
+    # Big Data Analytics
+    Tool(
+        name="get_bigdata_analytics",
+        description="Get all big data analytics",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_bigdata_analytic",
+        description="Get details of a specific big data analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic")
+    ),
+    Tool(
+        name="start_bigdata_analytic",
+        description="Start a big data analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic to start")
+    ),
+    Tool(
+        name="stop_bigdata_analytic",
+        description="Stop a big data analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic to stop")
+    ),
+    Tool(
+        name="get_bigdata_analytic_status",
+        description="Get the status of a big data analytic",
+        inputSchema=_id_schema("analytic_id", "The ID of the analytic")
+    ),
+    
+    # Services
+    Tool(
+        name="get_feature_services",
+        description="Get all feature services",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_feature_service",
+        description="Get details of a specific feature service",
+        inputSchema=_id_schema("service_id", "The ID of the feature service")
+    ),
+    Tool(
+        name="get_stream_services",
+        description="Get all stream services",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_stream_service",
+        description="Get details of a specific stream service",
+        inputSchema=_id_schema("service_id", "The ID of the stream service")
+    ),
+    
+    # Definitions
+    Tool(
+        name="get_feed_types",
+        description="Get all available feed type definitions",
+        inputSchema=_locale_schema("Locale for localized labels (e.g., 'en_US')")
+    ),
+    Tool(
+        name="get_tool_definitions",
+        description="Get all available tool definitions for analytics",
+        inputSchema=_locale_schema()
+    ),
+    Tool(
+        name="get_output_definitions",
+        description="Get all available output definitions",
+        inputSchema=_locale_schema()
+    ),
+    Tool(
+        name="get_source_definitions",
+        description="Get all available source definitions",
+        inputSchema=_locale_schema()
+    ),
+    
+    # System
+    Tool(
+        name="get_version",
+        description="Get the Velocity API version",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="query_logs",
+        description="Query system logs with various filters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_params": {
+                    "type": "object",
+                    "description": "Query parameters for filtering logs"
+                }
+            },
+            "required": ["query_params"]
+        }
+    ),
+    Tool(
+        name="export_configuration",
+        description="Export a snapshot of the current configuration",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="get_tenant_metrics",
+        description="Get tenant-level metrics summary",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+]
+
+
+# Input validators compiled once per tool. mcp's built-in validation rebuilds a
+# validator from the schema on every call, so call_tool opts out of it below.
+_VALIDATORS = {
+    tool.name: validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOLS
+}
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools"""
+    return _TOOLS
+
+
+# ========== Tool Dispatch ==========
+
+# Maps each tool name to a coroutine factory taking (client, arguments)
+_DISPATCH: Dict[str, Callable[[VelocityClient, Dict[str, Any]], Awaitable[Any]]] = {
+    # Feed Management
+    "get_feeds": lambda c, a: c.get_feeds(),
+    "get_feed": lambda c, a: c.get_feed(a["feed_id"]),
+    "create_feed": lambda c, a: c.create_feed(a["feed_data"]),
+    "update_feed": lambda c, a: c.update_feed(a["feed_id"], a["feed_data"]),
+    "delete_feed": lambda c, a: c.delete_feed(a["feed_id"]),
+    "start_feed": lambda c, a: c.start_feed(a["feed_id"]),
+    "stop_feed": lambda c, a: c.stop_feed(a["feed_id"]),
+    "get_feed_status": lambda c, a: c.get_feed_status(a["feed_id"]),
+    "get_feed_metrics": lambda c, a: c.get_feed_metrics(a["feed_id"], a.get("time_interval")),
+    "clone_feed": lambda c, a: c.clone_feed(a["feed_id"], a["name"], a.get("description")),
+    
+    # Real-Time Analytics
+    "get_realtime_analytics": lambda c, a: c.get_realtime_analytics(),
+    "get_realtime_analytic": lambda c, a: c.get_realtime_analytic(a["analytic_id"]),
+    "create_realtime_analytic": lambda c, a: c.create_realtime_analytic(a["analytic_data"]),
+    "update_realtime_analytic": lambda c, a: c.update_realtime_analytic(a["analytic_id"], a["analytic_data"]),
+    "delete_realtime_analytic": lambda c, a: c.delete_realtime_analytic(a["analytic_id"]),
+    "start_realtime_analytic": lambda c, a: c.start_realtime_analytic(a["analytic_id"]),
+    "stop_realtime_analytic": lambda c, a: c.stop_realtime_analytic(a["analytic_id"]),
+    "get_realtime_analytic_status": lambda c, a: c.get_realtime_analytic_status(a["analytic_id"]),
+    "get_realtime_analytic_metrics": lambda c, a: c.get_realtime_analytic_metrics(
+        a["analytic_id"], a.get("time_interval")
+    ),
+    
+    # Big Data Analytics
+    "get_bigdata_analytics": lambda c, a: c.get_bigdata_analytics(),
+    "get_bigdata_analytic": lambda c, a: c.get_bigdata_analytic(a["analytic_id"]),
+    "start_bigdata_analytic": lambda c, a: c.start_bigdata_analytic(a["analytic_id"]),
+    "stop_bigdata_analytic": lambda c, a: c.stop_bigdata_analytic(a["analytic_id"]),
+    "get_bigdata_analytic_status": lambda c, a: c.get_bigdata_analytic_status(a["analytic_id"]),
+    
+    # Services
+    "get_feature_services": lambda c, a: c.get_feature_services(),
+    "get_feature_service": lambda c, a: c.get_feature_service(a["service_id"]),
+    "get_stream_services": lambda c, a: c.get_stream_services(),
+    "get_stream_service": lambda c, a: c.get_stream_service(a["service_id"]),
+    
+    # Definitions
+    "get_feed_types": lambda c, a: c.get_feed_types(a.get("locale")),
+    "get_tool_definitions": lambda c, a: c.get_tool_definitions(a.get("locale")),
+    "get_output_definitions": lambda c, a: c.get_output_definitions(a.get("locale")),
+    "get_source_definitions": lambda c, a: c.get_source_definitions(a.get("locale")),
+    
+    # System
+    "get_version": lambda c, a: c.get_version(),
+    "query_logs": lambda c, a: c.query_logs(a["query_params"]),
+    "export_configuration": lambda c, a: c.export_configuration(),
+    "get_tenant_metrics": lambda c, a: c.get_tenant_metrics_summary(),
+}
+
+
+# ========== Request Coalescing ==========
+
+# Status and metrics tools that agents tend to poll in bursts. Identical calls
+# made while one is already in flight share its result instead of each going
+# out to Velocity. Each maps to the arguments its handler reads, which are all
+# that identify the call (anything else a caller sends is ignored).
+_COALESCED_TOOLS = {
+    "get_feed_status": ("feed_id",),
+    "get_feed_metrics": ("feed_id", "time_interval"),
+    "get_realtime_analytic_status": ("analytic_id",),
+    "get_realtime_analytic_metrics": ("analytic_id", "time_interval"),
+    "get_bigdata_analytic_status": ("analytic_id",),
+}
 
+# In-flight coalesced calls, keyed by tool name and arguments
+_in_flight: Dict[tuple, "asyncio.Future[Any]"] = {}
 
-@server.call_tool()
+
+def _call_key(name: str, arguments: Dict[str, Any]) -> tuple:
+    """Build a hashable key for a tool call from its name and the arguments it uses"""
+    return (name,) + tuple(arguments.get(param) for param in _COALESCED_TOOLS[name])
+
+
+def _call_done(key: tuple, future: "asyncio.Future[Any]") -> None:
+    """Forget a finished call, and mark its exception as seen in case every caller left"""
+    _in_flight.pop(key, None)
+    if not future.cancelled():
+        future.exception()
+
+
+def _coalesce(
+    name: str,
+    handler: Callable[[VelocityClient, Dict[str, Any]], Awaitable[Any]]
+) -> Callable[[VelocityClient, Dict[str, Any]], Awaitable[Any]]:
+    """Wrap a dispatch handler so identical concurrent calls share one request"""
+    
+    async def coalesced(client: VelocityClient, arguments: Dict[str, Any]) -> Any:
+        key = _call_key(name, arguments)
+        future = _in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(handler(client, arguments))
+            _in_flight[key] = future
+            future.add_done_callback(lambda f: _call_done(key, f))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(future)
+    
+    return coalesced
+
+
+for _name in _COALESCED_TOOLS:
+    _DISPATCH[_name] = _coalesce(_name, _DISPATCH[_name])
+
+
+# What VelocityClient returns for endpoints that reply with an empty body
+# (start/stop/delete and friends), and its pre-serialized tool response
+_SUCCESS_RESULT = {"success": True}
+_SUCCESS_RESPONSE = [TextContent(
+    type="text",
+    text=orjson.dumps(_SUCCESS_RESULT, option=orjson.OPT_INDENT_2).decode()
+)]
+
+
+def _format_result(result: Any) -> list[TextContent]:
+    """Serialize a tool result as MCP text content"""
+    if result == _SUCCESS_RESULT:
+        return _SUCCESS_RESPONSE
+    return [TextContent(
+        type="text",
+        text=orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    )]
+
+
+def _error_response(message: str) -> list[TextContent]:
+    """Wrap an error message as MCP text content"""
+    return [TextContent(type="text", text=f"Error: {message}")]
+
+
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls"""
     
-    async with create_velocity_client() as client:
-        try:
-            result = None
-            
-            # Feed Management
-            if name == "get_feeds":
-                result = await client.get_feeds()
-            elif name == "get_feed":
-                result = await client.get_feed(arguments["feed_id"])
-            elif name == "create_feed":
-                result = await client.create_feed(arguments["feed_data"])
-            elif name == "update_feed":
-                result = await client.update_feed(arguments["feed_id"], arguments["feed_data"])
-            elif name == "delete_feed":
-                result = await client.delete_feed(arguments["feed_id"])
-            elif name == "start_feed":
-                result = await client.start_feed(arguments["feed_id"])
-            elif name == "stop_feed":
-                result = await client.stop_feed(arguments["feed_id"])
-            elif name == "get_feed_status":
-                result = await client.get_feed_status(arguments["feed_id"])
-            elif name == "get_feed_metrics":
-                result = await client.get_feed_metrics(
-                    arguments["feed_id"],
-                    arguments.get("time_interval")
-                )
-            elif name == "clone_feed":
-                result = await client.clone_feed(
-                    arguments["feed_id"],
-                    arguments["name"],
-                    arguments.get("description")
-                )
-            
-            # Real-Time Analytics
-            elif name == "get_realtime_analytics":
-                result = await client.get_realtime_analytics()
-            elif name == "get_realtime_analytic":
-                result = await client.get_realtime_analytic(arguments["analytic_id"])
-            elif name == "create_realtime_analytic":
-                result = await client.create_realtime_analytic(arguments["analytic_data"])
-            elif name == "update_realtime_analytic":
-                result = await client.update_realtime_analytic(
-                    arguments["analytic_id"],
-                    arguments["analytic_data"]
-                )
-            elif name == "delete_realtime_analytic":
-                result = await client.delete_realtime_analytic(arguments["analytic_id"])
-            elif name == "start_realtime_analytic":
-                result = await client.start_realtime_analytic(arguments["analytic_id"])
-            elif name == "stop_realtime_analytic":
-                result = await client.stop_realtime_analytic(arguments["analytic_id"])
-            elif name == "get_realtime_analytic_status":
-                result = await client.get_realtime_analytic_status(arguments["analytic_id"])
-            elif name == "get_realtime_analytic_metrics":
-                result = await client.get_realtime_analytic_metrics(
-                    arguments["analytic_id"],
-                    arguments.get("time_interval")
-                )
-            
-            # Big Data Analytics
-            elif name == "get_bigdata_analytics":
-                result = await client.get_bigdata_analytics()
-            elif name == "get_bigdata_analytic":
-                result = await client.get_bigdata_analytic(arguments["analytic_id"])
-            elif name == "start_bigdata_analytic":
-                result = await client.start_bigdata_analytic(arguments["analytic_id"])
-            elif name == "stop_bigdata_analytic":
-                result = await client.stop_bigdata_analytic(arguments["analytic_id"])
-            elif name == "get_bigdata_analytic_status":
-                result = await client.get_bigdata_analytic_status(arguments["analytic_id"])
-            
-            # Services
-            elif name == "get_feature_services":
-                result = await client.get_feature_services()
-            elif name == "get_feature_service":
-                result = await client.get_feature_service(arguments["service_id"])
-            elif name == "get_stream_services":
-                result = await client.get_stream_services()
-            elif name == "get_stream_service":
-                result = await client.get_stream_service(arguments["service_id"])
-            
-            # Definitions
-            elif name == "get_feed_types":
-                result = await client.get_feed_types(arguments.get("locale"))
-            elif name == "get_tool_definitions":
-                result = await client.get_tool_definitions(arguments.get("locale"))
-            elif name == "get_output_definitions":
-                result = await client.get_output_definitions(arguments.get("locale"))
-            elif name == "get_source_definitions":
-                result = await client.get_source_definitions(arguments.get("locale"))
-            
-            # System
-            elif name == "get_version":
-                result = await client.get_version()
-            elif name == "query_logs":
-                result = await client.query_logs(arguments["query_params"])
-            elif name == "export_configuration":
-                result = await client.export_configuration()
-            elif name == "get_tenant_metrics":
-                result = await client.get_tenant_metrics_summary()
-            
-            else:
-                raise ValueError(f"Unknown tool: {name}")
-            
-            # Format the response
-            import json
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-            
-        except Exception as e:
-            logger.error(f"Error executing tool {name}: {str(e)}")
-            return [TextContent(
-                type="text",
-                text=f"Error: {str(e)}"
-            )]
+    # Names arrive freshly decoded from JSON; interning lets the dispatch and
+    # validator lookups below match our interned keys by identity
+    name = sys.intern(name)
+    
+    # Reject bad calls up front without going through raise/except
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        logger.error("Unknown tool: %s", name)
+        return _error_response(f"Unknown tool: {name}")
+    
+    if _client is None:
+        logger.error("Tool %s called without a Velocity client", name)
+        return _error_response(_client_error or "Velocity client is not initialized")
+    
+    # Raised rather than returned so mcp reports it as an error result (isError),
+    # the same as its own validation does
+    try:
+        _VALIDATORS[name].validate(arguments)
+    except ValidationError as e:
+        logger.error("Invalid arguments for tool %s: %s", name, e.message)
+        raise ValueError(f"Input validation error: {e.message}") from None
+    
+    try:
+        return _format_result(await handler(_client, arguments))
+    except Exception as e:
+        logger.error("Error executing tool %s: %s", name, e)
+        return _error_response(str(e))
+
+
+async def _serve(init_options) -> None:
+    """Serve MCP requests over stdio until the client disconnects"""
+    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, init_options)
 
 
 async def main():
     """Run the MCP server"""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    global _client, _client_error
+    
+    # Configure logging here rather than at import so embedding apps keep theirs
+    logging.basicConfig(level=logging.INFO)
+    
+    # Build everything the session needs before the transport starts reading
+    init_options = server.create_initialization_options()
+    
+    try:
+        client = create_velocity_client()
+    except ValueError as e:
+        # Still start, so the tools are listed and each call reports what's missing
+        logger.error("Configuration error: %s", e)
+        _client_error = str(e)
+        await _serve(init_options)
+        return
+    
+    # Keep one client (and its connection pool and token) for the whole session
+    async with client:
+        _client = client
+        try:
+            await _serve(init_options)
+        finally:
+            _client = None
 
 
 if __name__ == "__main__":
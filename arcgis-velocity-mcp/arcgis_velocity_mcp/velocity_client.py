@@ -4,18 +4,282 @@ ArcGIS Velocity API Client
 This module provides a client for interacting with the ArcGIS Velocity REST API.
 """
 
+import asyncio
 import httpx
-from typing import Optional, Dict, Any, List
+import orjson
+from typing import Optional, Dict, Any, List, Iterable, Awaitable, Union
 import logging
-from datetime import datetime, timedelta
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
+# Token lifetime requested from the portal, in minutes
+_TOKEN_EXPIRATION_MINUTES = 60
+
+# Fraction of a token's lifetime after which it is refreshed
+_TOKEN_REFRESH_FRACTION = 0.5
+
+# Fraction of a token's lifetime ahead of that deadline at which the background
+# refresher renews it, so requests find a fresh token rather than waiting on one
+_TOKEN_BACKGROUND_LEAD_FRACTION = 0.1
+
+# Shortest token lifetime assumed, in seconds, so an expiry that is already past
+# (e.g. from clock skew) can't make every request and the refresher loop
+# regenerate the token back to back
+_TOKEN_MIN_LIFETIME = 60.0
+
+# Retry policy for transient failures: attempts in total, and the backoff
+# base/cap in seconds (delays double per attempt with +/-50% jitter)
+_RETRY_MAX_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.2
+_RETRY_MAX_DELAY = 10.0
+
+# How long cached catalog responses are reused, in seconds
+_DEFINITIONS_TTL = 300.0
+_VERSION_TTL = 3600.0
+
+# Request timeouts: metadata lookups fail fast, bulk log/configuration calls
+# get minutes, and everything else uses the default. First matching prefix wins.
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_ENDPOINT_TIMEOUTS = (
+    ("/iot/api/version", httpx.Timeout(5.0)),
+    ("/iot/feed/types", httpx.Timeout(5.0)),
+    ("/iot/feed/type/", httpx.Timeout(5.0)),
+    ("/iot/analytics/tools", httpx.Timeout(5.0)),
+    ("/iot/outputs", httpx.Timeout(5.0)),
+    ("/iot/sources", httpx.Timeout(5.0)),
+    ("/iot/formats", httpx.Timeout(5.0)),
+    ("/iot/configuration", httpx.Timeout(300.0, connect=5.0)),
+    ("/iot/logs", httpx.Timeout(120.0, connect=5.0)),
+)
+
+# Status codes worth retrying: throttling and gateway/availability errors
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Status codes that count against a host's health in its circuit breaker. A
+# plain 500/501 is usually about the request itself, not the host being down.
+_CIRCUIT_FAILURE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Methods that are safe to repeat, plus POST endpoints that only read or validate
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+_SAFE_POST_MARKERS = ("/validate", "/metrics", "/iot/logs")
+
+
+def _timeout_for(endpoint: str) -> httpx.Timeout:
+    """Pick the request timeout for an endpoint"""
+    for prefix, timeout in _ENDPOINT_TIMEOUTS:
+        if endpoint.startswith(prefix):
+            return timeout
+    return _DEFAULT_TIMEOUT
+
+
+def _is_idempotent(method: str, endpoint: str) -> bool:
+    """Check whether a request can be repeated without side effects"""
+    return method in _IDEMPOTENT_METHODS or any(m in endpoint for m in _SAFE_POST_MARKERS)
+
+
+def _should_retry(error: Exception, idempotent: bool) -> bool:
+    """Decide whether a failed request is worth another attempt"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        # A 429 means the request was not processed, so any method can retry it
+        return status == 429 or (idempotent and status in _RETRY_STATUS_CODES)
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        # The request never reached the server
+        return True
+    return idempotent and isinstance(error, httpx.TransportError)
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Work out how long to wait before the next attempt"""
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(_RETRY_MAX_DELAY, float(retry_after))
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host's circuit breaker is open and requests fail fast"""
+
+
+class _CircuitBreaker:
+    """
+    Per-host circuit breaker.
+    
+    After failure_threshold consecutive failed requests (each counted once,
+    however many attempts it took) the circuit opens and requests fail
+    immediately. Once reset_timeout has passed, a single probe request is
+    let through (half-open): success closes the circuit, failure reopens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def check(self) -> None:
+        """Raise CircuitOpenError if requests to this host should fail fast"""
+        if self.state == self.CLOSED:
+            return
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            raise CircuitOpenError(f"Circuit open for {self.name}, failing fast")
+        # Cooldown is over: let this request through as the probe
+        self.state = self.HALF_OPEN
+        self.opened_at = now
+    
+    def record(self, response: httpx.Response) -> None:
+        """Record the outcome of a request that got a response"""
+        if response.status_code in _CIRCUIT_FAILURE_STATUS_CODES:
+            self.record_failure()
+        else:
+            self.record_success()
+    
+    def record_error(self, error: Exception) -> None:
+        """Record the outcome of a request that finally failed with error"""
+        if isinstance(error, httpx.HTTPStatusError):
+            self.record(error.response)
+        else:
+            self.record_failure()
+    
+    def record_success(self) -> None:
+        """Close the circuit after a healthy response"""
+        if self.state != self.CLOSED:
+            logger.info("Circuit for %s closed", self.name)
+        self.state = self.CLOSED
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit if the threshold is reached"""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    "Circuit for %s opened after %d failures", self.name, self.failures
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class _TokenBucket:
+    """
+    Token-bucket rate limiter.
+    
+    Allows bursts of up to capacity requests, refilling at rate tokens per
+    second. Waiters are served in arrival order.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+    
+    async def acquire(self, n: float = 1.0) -> None:
+        """Wait until n tokens are available, then take them"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= n
+
+
+class _BearerAuth(httpx.Auth):
+    """Adds a token's Authorization header, formatted once rather than per request"""
+    
+    def __init__(self, token: str):
+        self.header = f"Bearer {token}"
+    
+    def auth_flow(self, request: httpx.Request):
+        request.headers["Authorization"] = self.header
+        yield request
+
+
+# Sent with JSON request bodies; httpx copies it into each request
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Base paths of the CRUD-style resources
+_FEED_PATH = "/iot/feed"
+_REALTIME_PATH = "/iot/analytics/realtime"
+_BIGDATA_PATH = "/iot/analytics/bigdata"
+_FEATURE_SERVICE_PATH = "/iot/services/feature"
+_STREAM_SERVICE_PATH = "/iot/services/stream"
+
+# Endpoints without path parameters, whose full URLs each client builds once
+_STATIC_ENDPOINTS = (
+    _FEED_PATH,
+    _REALTIME_PATH,
+    _BIGDATA_PATH,
+    _FEATURE_SERVICE_PATH,
+    _STREAM_SERVICE_PATH,
+    "/iot/feed/status",
+    "/iot/analytics/realtime/status",
+    "/iot/analytics/bigdata/status",
+    "/iot/services",
+    "/iot/feed/types",
+    "/iot/analytics/tools",
+    "/iot/outputs",
+    "/iot/sources",
+    "/iot/formats",
+    "/iot/logs",
+    "/iot/configuration/export",
+    "/iot/configuration/import",
+    "/iot/configuration/reset",
+    "/iot/tenant/settings",
+    "/iot/tenant/metrics/status",
+    "/iot/tenant/metrics/history",
+    "/iot/api/version",
+)
+
 
 class VelocityClient:
     """Client for interacting with ArcGIS Velocity API with automatic token management"""
     
-    def __init__(self, base_url: str, username: str, password: str, portal_url: str):
+    __slots__ = (
+        "base_url", "username", "password", "portal_url", "client",
+        "_shared_key", "_static_urls", "_token", "_auth", "_token_expiry_mono",
+        "_token_lifetime", "_token_lock", "_refresh_task", "_portal_circuit", "_api_circuit",
+        "_max_concurrency", "_semaphore", "_rate_limiter",
+        "_response_cache", "_cache_locks"
+    )
+    
+    # HTTP clients shared between instances created with share_client=True,
+    # keyed by base URL, and how many entered instances hold each client. Counts
+    # are kept per client object, so replacing a closed client never disturbs
+    # the count of one that is still held.
+    _shared_clients: Dict[str, httpx.AsyncClient] = {}
+    _shared_refcounts: Dict[httpx.AsyncClient, int] = {}
+    
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        portal_url: str,
+        max_concurrency: int = 32,
+        rps: float = 10.0,
+        burst: int = 20,
+        share_client: bool = False
+    ):
         """
         Initialize the Velocity API client.
         
@@ -24,20 +288,115 @@ class VelocityClient:
             username: ArcGIS username
             password: ArcGIS password
             portal_url: Portal URL for token generation (e.g., https://www.arcgis.com)
+            max_concurrency: Maximum number of Velocity API requests in flight at once
+            rps: Sustained Velocity API request rate, in requests per second
+            burst: Number of requests that may be sent back to back above that rate
+            share_client: Reuse one HTTP connection pool with other clients for the
+                same base URL; token and rate limiting state stay per instance. The
+                pool is taken on entering the client with async with, and released
+                on exit
+        
+        Raises:
+            ValueError: If max_concurrency or rps is not positive, or burst is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if rps <= 0:
+            raise ValueError("rps must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
         self.portal_url = portal_url.rstrip('/')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Parsed once here instead of on every request to these endpoints; other
+        # paths are joined onto the client's base_url by httpx
+        self._static_urls = {
+            endpoint: httpx.URL(self.base_url + endpoint) for endpoint in _STATIC_ENDPOINTS
+        }
+        # Shared clients are only attached in __aenter__, so an instance that is
+        # never entered holds no reference to one
+        self._shared_key: Optional[str] = self.base_url if share_client else None
+        self.client: Optional[httpx.AsyncClient] = (
+            None if share_client else self._create_http_client()
+        )
         self._token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
+        self._auth: Optional[_BearerAuth] = None
+        # Monotonic-clock deadline for refreshing the token, and its lifetime in seconds
+        self._token_expiry_mono: float = 0.0
+        self._token_lifetime: float = 0.0
+        # Serializes token refreshes so concurrent callers share one generateToken call
+        self._token_lock = asyncio.Lock()
+        # Background task that renews the token while the client is entered
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Fail fast while the portal or the Velocity API is down
+        self._portal_circuit = _CircuitBreaker("portal")
+        self._api_circuit = _CircuitBreaker("Velocity API")
+        # Caps in-flight API requests so large fan-outs don't swamp the server
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Smooths bursts down to a rate the server won't throttle
+        self._rate_limiter = _TokenBucket(rps, burst)
+        # Cached catalog responses as (expires_at, result), plus per-key locks so a
+        # cold entry is fetched once however many callers ask for it
+        self._response_cache: Dict[tuple, tuple] = {}
+        self._cache_locks: Dict[tuple, asyncio.Lock] = {}
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client used for both the portal and the Velocity API"""
+        # HTTP/2 multiplexes concurrent tool calls over one TLS connection per host;
+        # the pool limits leave room for bursty fan-out and keep idle connections warm
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=_DEFAULT_TIMEOUT,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+                keepalive_expiry=60.0
+            )
+        )
         
     async def __aenter__(self):
+        if self._shared_key is not None:
+            self._acquire_shared_client()
+        self._refresh_task = asyncio.create_task(self._token_refresher())
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        
+        if self._shared_key is None:
+            await self.client.aclose()
+        else:
+            await self._release_shared_client()
+    
+    def _acquire_shared_client(self) -> None:
+        """Attach the shared HTTP client for this base URL, creating it if needed"""
+        client = self._shared_clients.get(self._shared_key)
+        if client is None or client.is_closed:
+            client = self._create_http_client()
+            self._shared_clients[self._shared_key] = client
+        self._shared_refcounts[client] = self._shared_refcounts.get(client, 0) + 1
+        self.client = client
+    
+    async def _release_shared_client(self) -> None:
+        """Drop this instance's reference, closing the client if it was the last"""
+        client = self.client
+        self.client = None
+        self._shared_refcounts[client] -= 1
+        if self._shared_refcounts[client] == 0:
+            del self._shared_refcounts[client]
+            if self._shared_clients.get(self._shared_key) is client:
+                del self._shared_clients[self._shared_key]
+            await client.aclose()
     
     async def _generate_token(self) -> Dict[str, Any]:
         """
@@ -53,11 +412,17 @@ class VelocityClient:
             "password": self.password,
             "referer": self.base_url,
             "f": "json",
-            "expiration": 60  # 60 minutes
+            "expiration": _TOKEN_EXPIRATION_MINUTES
         }
         
         try:
-            response = await self.client.post(token_url, data=data)
+            self._portal_circuit.check()
+            try:
+                response = await self.client.post(token_url, data=data)
+            except httpx.TransportError:
+                self._portal_circuit.record_failure()
+                raise
+            self._portal_circuit.record(response)
             response.raise_for_status()
             token_data = response.json()
             
@@ -69,9 +434,62 @@ class VelocityClient:
             return token_data
             
         except Exception as e:
-            logger.error(f"Error generating token: {str(e)}")
+            logger.error("Error generating token: %s", e)
             raise
     
+    async def _refresh_token(self) -> None:
+        """Generate a new token and work out when it should next be refreshed"""
+        logger.info("Generating new token...")
+        requested_at = time.monotonic()
+        token_data = await self._generate_token()
+        self._token = token_data["token"]
+        self._auth = _BearerAuth(self._token)
+        
+        # Token expiry is in milliseconds from epoch
+        expiry_ms = token_data.get("expires", 0)
+        if expiry_ms:
+            lifetime = expiry_ms / 1000 - time.time()
+            if lifetime < _TOKEN_MIN_LIFETIME:
+                logger.warning(
+                    "Portal reported a token lifetime of %.0f seconds, assuming %.0f",
+                    lifetime, _TOKEN_MIN_LIFETIME
+                )
+                lifetime = _TOKEN_MIN_LIFETIME
+            self._token_lifetime = lifetime
+        else:
+            # Fall back to the lifetime we asked for if no expiry provided
+            self._token_lifetime = _TOKEN_EXPIRATION_MINUTES * 60.0
+        
+        # Refresh partway through the lifetime, measured on the monotonic clock
+        # so wall-clock jumps can't make the token look fresher than it is
+        self._token_expiry_mono = requested_at + self._token_lifetime * _TOKEN_REFRESH_FRACTION
+        
+        logger.info(
+            "Token will be refreshed in %.0f seconds",
+            self._token_expiry_mono - time.monotonic()
+        )
+    
+    def _token_is_valid(self) -> bool:
+        """Check whether the current token exists and is not due for refresh"""
+        return self._token is not None and time.monotonic() < self._token_expiry_mono
+    
+    async def _token_refresher(self) -> None:
+        """Renew the token in the background shortly before it is due for refresh"""
+        while True:
+            try:
+                async with self._token_lock:
+                    lead = self._token_lifetime * _TOKEN_BACKGROUND_LEAD_FRACTION
+                    if self._token is None or time.monotonic() >= self._token_expiry_mono - lead:
+                        await self._refresh_token()
+            except Exception as e:
+                # Requests fall back to refreshing the token themselves
+                logger.warning("Background token refresh failed: %s", e)
+                await asyncio.sleep(_RETRY_MAX_DELAY)
+                continue
+            
+            lead = self._token_lifetime * _TOKEN_BACKGROUND_LEAD_FRACTION
+            await asyncio.sleep(max(1.0, self._token_expiry_mono - lead - time.monotonic()))
+    
     async def _ensure_valid_token(self) -> str:
         """
         Ensure we have a valid token, generating a new one if needed.
@@ -79,31 +497,29 @@ class VelocityClient:
         Returns:
             Valid authentication token
         """
-        # Check if we need a new token
-        if self._token is None or self._token_expiry is None or datetime.now() >= self._token_expiry:
-            logger.info("Token expired or missing, generating new token...")
-            token_data = await self._generate_token()
-            self._token = token_data["token"]
-            
-            # Token expiry is in milliseconds from epoch
-            expiry_ms = token_data.get("expires", 0)
-            if expiry_ms:
-                self._token_expiry = datetime.fromtimestamp(expiry_ms / 1000)
-                # Refresh 5 minutes before actual expiry
-                self._token_expiry = self._token_expiry - timedelta(minutes=5)
-            else:
-                # Default to 55 minutes from now if no expiry provided
-                self._token_expiry = datetime.now() + timedelta(minutes=55)
-            
-            logger.info(f"Token will be refreshed at {self._token_expiry}")
+        if not self._token_is_valid():
+            async with self._token_lock:
+                # Another caller may have refreshed while we waited for the lock
+                if not self._token_is_valid():
+                    await self._refresh_token()
         
         return self._token
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests (without auth, will be added per request)"""
-        return {
-            "Content-Type": "application/json"
-        }
+    async def _replace_rejected_token(self, rejected: str) -> str:
+        """
+        Replace a token the server rejected, unless another caller already has.
+        
+        Args:
+            rejected: The token that got a 401
+            
+        Returns:
+            Valid authentication token
+        """
+        async with self._token_lock:
+            if self._token == rejected:
+                await self._refresh_token()
+        
+        return self._token
     
     async def _request(
         self, 
@@ -124,105 +540,306 @@ class VelocityClient:
         Returns:
             Response data as dictionary
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._static_urls.get(endpoint) or endpoint
         
         # Ensure we have a valid token
         token = await self._ensure_valid_token()
         
-        # Add token to headers
-        headers = self._get_headers()
-        headers["Authorization"] = f"Bearer {token}"
-        
         try:
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json
-            )
-            response.raise_for_status()
-            
-            # Some endpoints return empty responses
-            if response.status_code == 204 or not response.content:
-                return {"success": True}
-                
-            return response.json()
+            # self._auth always matches self._token; nothing awaits in between
+            response = await self._send(method, endpoint, url, self._auth, params, json)
             
         except httpx.HTTPStatusError as e:
             # If we get a 401, the token might be invalid - try regenerating once
             if e.response.status_code == 401:
                 logger.warning("Received 401, attempting to regenerate token...")
-                self._token = None  # Force token regeneration
-                token = await self._ensure_valid_token()
-                headers["Authorization"] = f"Bearer {token}"
-                
-                # Retry the request
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json
-                )
+                await self._replace_rejected_token(token)
+                response = await self._send(method, endpoint, url, self._auth, params, json)
+            else:
+                logger.error("HTTP error: %s - %s", e.response.status_code, e.response.text)
+                raise
+        except Exception as e:
+            logger.error("Request error: %s", e)
+            raise
+        
+        # Some endpoints return empty responses
+        if response.status_code == 204 or not response.content:
+            return {"success": True}
+            
+        return orjson.loads(response.content)
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: Union[str, httpx.URL],
+        auth: httpx.Auth,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]]
+    ) -> httpx.Response:
+        """
+        Send a single API request, retrying transient failures with backoff.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            url: Prebuilt URL, or the endpoint path relative to base_url
+            auth: Authorization for the current token
+            params: Query parameters
+            json: JSON body data
+            
+        Returns:
+            Successful (2xx) response
+        """
+        # Serialized once up front rather than by httpx on every retry
+        content = None
+        headers = None
+        if json is not None:
+            content = orjson.dumps(json)
+            headers = _JSON_HEADERS
+        idempotent = _is_idempotent(method, endpoint)
+        timeout = _timeout_for(endpoint)
+        
+        # Checked and recorded once per request rather than per attempt, so one
+        # request's retries don't add up to "consecutive failures" on their own
+        self._api_circuit.check()
+        
+        for attempt in range(_RETRY_MAX_ATTEMPTS):
+            # Every attempt, retries included, counts against the rate limit
+            await self._rate_limiter.acquire()
+            try:
+                # Held only for the request itself, not the token check or backoff
+                async with self._semaphore:
+                    response = await self.client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        content=content,
+                        auth=auth,
+                        timeout=timeout
+                    )
                 response.raise_for_status()
+                self._api_circuit.record_success()
+                return response
                 
-                if response.status_code == 204 or not response.content:
-                    return {"success": True}
-                    
-                return response.json()
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if attempt == _RETRY_MAX_ATTEMPTS - 1 or not _should_retry(e, idempotent):
+                    self._api_circuit.record_error(e)
+                    raise
+                delay = _retry_delay(attempt, e)
+                reason = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else e
+                logger.warning(
+                    "%s %s failed (%s), retrying in %.2f seconds",
+                    method, endpoint, reason, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = _DEFINITIONS_TTL
+    ) -> Any:
+        """
+        GET an endpoint whose response rarely changes, reusing it for ttl seconds.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            ttl: How long to reuse the response, in seconds
             
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"Request error: {str(e)}")
-            raise
+        Returns:
+            Response data, possibly shared with other callers (don't mutate it)
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        entry = self._response_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                entry = self._response_cache.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1]
+                result = await self._request("GET", endpoint, params=params)
+                self._response_cache[key] = (time.monotonic() + ttl, result)
+                return result
+        finally:
+            # Only needed while a fill is in progress; callers already waiting
+            # hold their own reference, so dropping it keeps the dict from
+            # growing with every name/locale ever requested
+            if self._cache_locks.get(key) is lock:
+                del self._cache_locks[key]
+    
+    def invalidate_definitions(self) -> None:
+        """Drop all cached definition and version responses"""
+        self._response_cache.clear()
+    
+    async def gather_limited(
+        self,
+        coros: Iterable[Awaitable[Any]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Run a fan-out of client calls concurrently, at most max_concurrency at a time.
+        
+        Args:
+            coros: Awaitables to run, typically calls to this client's methods
+            return_exceptions: Return exceptions in the results instead of raising
+            
+        Returns:
+            Results in the same order as coros
+        """
+        # A separate limiter of the same size: the calls themselves acquire
+        # self._semaphore inside _send, so holding it here as well could deadlock
+        limiter = asyncio.Semaphore(self._max_concurrency)
+        
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with limiter:
+                return await coro
+        
+        return await asyncio.gather(
+            *(run(coro) for coro in coros),
+            return_exceptions=return_exceptions
+        )
+    
+    # ========== Resource Helpers ==========
+    
+    # Shared by the feed, analytic and service methods below, which differ only
+    # in their base path
+    
+    async def _list_items(self, path: str) -> List[Dict[str, Any]]:
+        """Get all items of a resource"""
+        return await self._request("GET", path)
+    
+    async def _get_item(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Get a single item"""
+        return await self._request("GET", f"{path}/{item_id}")
+    
+    async def _create_item(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an item"""
+        return await self._request("POST", path, json=data)
+    
+    async def _update_item(self, path: str, item_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace an item's definition"""
+        return await self._request("PUT", f"{path}/{item_id}", json=data)
+    
+    async def _delete_item(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Delete an item"""
+        return await self._request("DELETE", f"{path}/{item_id}")
+    
+    async def _start_item(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Start an item"""
+        return await self._request("GET", f"{path}/{item_id}/start")
+    
+    async def _stop_item(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Stop an item"""
+        return await self._request("GET", f"{path}/{item_id}/stop")
+    
+    async def _get_item_status(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Get an item's status"""
+        return await self._request("GET", f"{path}/{item_id}/status")
+    
+    async def _get_item_metrics(
+        self,
+        path: str,
+        item_id: str,
+        time_interval: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get an item's metrics"""
+        # No body at all rather than an empty object when there's no interval
+        body = {"timeInterval": time_interval} if time_interval else None
+        return await self._request("POST", f"{path}/metrics/{item_id}", json=body)
+    
+    async def _clone_item(
+        self,
+        path: str,
+        item_id: str,
+        name: str,
+        description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Clone an item under a new name"""
+        body = {"name": name}
+        if description:
+            body["description"] = description
+        return await self._request("POST", f"{path}/{item_id}/clone", json=body)
+    
+    async def _scale_item(
+        self,
+        path: str,
+        item_id: str,
+        cpu: float,
+        memory: float,
+        instances: int
+    ) -> Dict[str, Any]:
+        """Scale a running item"""
+        body = {
+            "cpu": cpu,
+            "memory": memory,
+            "instances": instances
+        }
+        return await self._request("PUT", f"{path}/{item_id}/scale", json=body)
+    
+    async def _validate_item(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an item definition"""
+        return await self._request("POST", f"{path}/validate", json=data)
+    
+    async def _validate_item_by_id(self, path: str, item_id: str) -> Dict[str, Any]:
+        """Validate an existing item"""
+        return await self._request("GET", f"{path}/validate/{item_id}")
     
     # ========== Feed Management ==========
     
     async def get_feeds(self) -> List[Dict[str, Any]]:
         """Get all feeds"""
-        return await self._request("GET", "/iot/feed")
+        return await self._list_items(_FEED_PATH)
     
     async def get_feed(self, feed_id: str) -> Dict[str, Any]:
         """Get a specific feed by ID"""
-        return await self._request("GET", f"/iot/feed/{feed_id}")
+        return await self._get_item(_FEED_PATH, feed_id)
     
     async def create_feed(self, feed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new feed"""
-        return await self._request("POST", "/iot/feed", json=feed_data)
+        return await self._create_item(_FEED_PATH, feed_data)
     
     async def update_feed(self, feed_id: str, feed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing feed"""
-        return await self._request("PUT", f"/iot/feed/{feed_id}", json=feed_data)
+        return await self._update_item(_FEED_PATH, feed_id, feed_data)
     
     async def delete_feed(self, feed_id: str) -> Dict[str, Any]:
         """Delete a feed"""
-        return await self._request("DELETE", f"/iot/feed/{feed_id}")
+        return await self._delete_item(_FEED_PATH, feed_id)
     
     async def start_feed(self, feed_id: str) -> Dict[str, Any]:
         """Start a feed"""
-        return await self._request("GET", f"/iot/feed/{feed_id}/start")
+        return await self._start_item(_FEED_PATH, feed_id)
     
     async def stop_feed(self, feed_id: str) -> Dict[str, Any]:
         """Stop a feed"""
-        return await self._request("GET", f"/iot/feed/{feed_id}/stop")
+        return await self._stop_item(_FEED_PATH, feed_id)
     
     async def get_feed_status(self, feed_id: str) -> Dict[str, Any]:
         """Get feed status"""
-        return await self._request("GET", f"/iot/feed/{feed_id}/status")
+        return await self._get_item_status(_FEED_PATH, feed_id)
     
     async def get_all_feed_status(self, item_ids: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get status of all feeds, optionally filtered by item IDs"""
         params = {"itemIds": item_ids} if item_ids else None
         return await self._request("GET", "/iot/feed/status", params=params)
     
+    async def get_feed_statuses(self, feed_ids: List[str]) -> List[Any]:
+        """Get the status of several feeds concurrently; failures are returned in place"""
+        return await self.gather_limited(
+            (self.get_feed_status(feed_id) for feed_id in feed_ids),
+            return_exceptions=True
+        )
+    
     async def get_feed_metrics(self, feed_id: str, time_interval: Optional[str] = None) -> Dict[str, Any]:
         """Get feed metrics"""
-        body = {}
-        if time_interval:
-            body["timeInterval"] = time_interval
-        return await self._request("POST", f"/iot/feed/metrics/{feed_id}", json=body)
+        return await self._get_item_metrics(_FEED_PATH, feed_id, time_interval)
     
     async def get_feed_history(
         self, 
@@ -242,76 +859,72 @@ class VelocityClient:
     
     async def clone_feed(self, feed_id: str, name: str, description: Optional[str] = None) -> Dict[str, Any]:
         """Clone a feed"""
-        body = {"name": name}
-        if description:
-            body["description"] = description
-        return await self._request("POST", f"/iot/feed/{feed_id}/clone", json=body)
+        return await self._clone_item(_FEED_PATH, feed_id, name, description)
     
     async def validate_feed(self, feed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a feed configuration"""
-        return await self._request("POST", "/iot/feed/validate", json=feed_data)
+        return await self._validate_item(_FEED_PATH, feed_data)
     
     async def validate_feed_by_id(self, feed_id: str) -> Dict[str, Any]:
         """Validate a feed by ID"""
-        return await self._request("GET", f"/iot/feed/validate/{feed_id}")
+        return await self._validate_item_by_id(_FEED_PATH, feed_id)
     
     async def scale_feed(self, feed_id: str, cpu: float, memory: float, instances: int) -> Dict[str, Any]:
         """Scale a running feed"""
-        body = {
-            "cpu": cpu,
-            "memory": memory,
-            "instances": instances
-        }
-        return await self._request("PUT", f"/iot/feed/{feed_id}/scale", json=body)
+        return await self._scale_item(_FEED_PATH, feed_id, cpu, memory, instances)
     
     # ========== Real-Time Analytics ==========
     
     async def get_realtime_analytics(self) -> List[Dict[str, Any]]:
         """Get all real-time analytics"""
-        return await self._request("GET", "/iot/analytics/realtime")
+        return await self._list_items(_REALTIME_PATH)
     
     async def get_realtime_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Get a specific real-time analytic"""
-        return await self._request("GET", f"/iot/analytics/realtime/{analytic_id}")
+        return await self._get_item(_REALTIME_PATH, analytic_id)
     
     async def create_realtime_analytic(self, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new real-time analytic"""
-        return await self._request("POST", "/iot/analytics/realtime", json=analytic_data)
+        return await self._create_item(_REALTIME_PATH, analytic_data)
     
     async def update_realtime_analytic(self, analytic_id: str, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing real-time analytic"""
-        return await self._request("PUT", f"/iot/analytics/realtime/{analytic_id}", json=analytic_data)
+        return await self._update_item(_REALTIME_PATH, analytic_id, analytic_data)
     
     async def delete_realtime_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Delete a real-time analytic"""
-        return await self._request("DELETE", f"/iot/analytics/realtime/{analytic_id}")
+        return await self._delete_item(_REALTIME_PATH, analytic_id)
     
     async def start_realtime_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Start a real-time analytic"""
-        return await self._request("GET", f"/iot/analytics/realtime/{analytic_id}/start")
+        return await self._start_item(_REALTIME_PATH, analytic_id)
     
     async def stop_realtime_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Stop a real-time analytic"""
-        return await self._request("GET", f"/iot/analytics/realtime/{analytic_id}/stop")
+        return await self._stop_item(_REALTIME_PATH, analytic_id)
     
     async def get_realtime_analytic_status(self, analytic_id: str) -> Dict[str, Any]:
         """Get real-time analytic status"""
-        return await self._request("GET", f"/iot/analytics/realtime/{analytic_id}/status")
+        return await self._get_item_status(_REALTIME_PATH, analytic_id)
     
     async def get_all_realtime_analytics_status(self) -> Dict[str, Any]:
         """Get status of all real-time analytics"""
         return await self._request("GET", "/iot/analytics/realtime/status")
     
+    async def get_realtime_analytic_statuses(self, analytic_ids: List[str]) -> List[Any]:
+        """Get the status of several real-time analytics concurrently; failures are returned in place"""
+        return await self.gather_limited(
+            (self.get_realtime_analytic_status(analytic_id) for analytic_id in analytic_ids),
+            return_exceptions=True
+        )
+    
     async def get_realtime_analytic_metrics(
         self, 
         analytic_id: str, 
         time_interval: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get real-time analytic metrics"""
-        body = {}
-        if time_interval:
-            body["timeInterval"] = time_interval
-        return await self._request("POST", f"/iot/analytics/realtime/metrics/{analytic_id}", json=body)
+        return await self._get_item_metrics(_REALTIME_PATH, analytic_id, time_interval)
     
     async def clone_realtime_analytic(
         self, 
@@ -320,10 +933,7 @@ class VelocityClient:
         description: Optional[str] = None
     ) -> Dict[str, Any]:
         """Clone a real-time analytic"""
-        body = {"name": name}
-        if description:
-            body["description"] = description
-        return await self._request("POST", f"/iot/analytics/realtime/{analytic_id}/clone", json=body)
+        return await self._clone_item(_REALTIME_PATH, analytic_id, name, description)
     
     async def scale_realtime_analytic(
         self, 
@@ -333,50 +943,45 @@ class VelocityClient:
         instances: int
     ) -> Dict[str, Any]:
         """Scale a running real-time analytic"""
-        body = {
-            "cpu": cpu,
-            "memory": memory,
-            "instances": instances
-        }
-        return await self._request("PUT", f"/iot/analytics/realtime/{analytic_id}/scale", json=body)
+        return await self._scale_item(_REALTIME_PATH, analytic_id, cpu, memory, instances)
     
     async def validate_realtime_analytic(self, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a real-time analytic configuration"""
-        return await self._request("POST", "/iot/analytics/realtime/validate", json=analytic_data)
+        return await self._validate_item(_REALTIME_PATH, analytic_data)
     
     async def validate_realtime_analytic_by_id(self, analytic_id: str) -> Dict[str, Any]:
         """Validate a real-time analytic by ID"""
-        return await self._request("GET", f"/iot/analytics/realtime/validate/{analytic_id}")
+        return await self._validate_item_by_id(_REALTIME_PATH, analytic_id)
     
     # ========== Big Data Analytics ==========
     
     async def get_bigdata_analytics(self) -> List[Dict[str, Any]]:
         """Get all big data analytics"""
-        return await self._request("GET", "/iot/analytics/bigdata")
+        return await self._list_items(_BIGDATA_PATH)
     
     async def get_bigdata_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Get a specific big data analytic"""
-        return await self._request("GET", f"/iot/analytics/bigdata/{analytic_id}")
+        return await self._get_item(_BIGDATA_PATH, analytic_id)
     
     async def create_bigdata_analytic(self, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new big data analytic"""
-        return await self._request("POST", "/iot/analytics/bigdata", json=analytic_data)
+        return await self._create_item(_BIGDATA_PATH, analytic_data)
     
     async def update_bigdata_analytic(self, analytic_id: str, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing big data analytic"""
-        return await self._request("PUT", f"/iot/analytics/bigdata/{analytic_id}", json=analytic_data)
+        return await self._update_item(_BIGDATA_PATH, analytic_id, analytic_data)
     
     async def delete_bigdata_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Delete a big data analytic"""
-        return await self._request("DELETE", f"/iot/analytics/bigdata/{analytic_id}")
+        return await self._delete_item(_BIGDATA_PATH, analytic_id)
     
     async def start_bigdata_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Start a big data analytic"""
-        return await self._request("GET", f"/iot/analytics/bigdata/{analytic_id}/start")
+        return await self._start_item(_BIGDATA_PATH, analytic_id)
     
     async def stop_bigdata_analytic(self, analytic_id: str) -> Dict[str, Any]:
         """Stop a big data analytic"""
-        return await self._request("GET", f"/iot/analytics/bigdata/{analytic_id}/stop")
+        return await self._stop_item(_BIGDATA_PATH, analytic_id)
     
     async def get_bigdata_analytic_status(self, analytic_id: str, watch: Optional[bool] = None) -> Dict[str, Any]:
         """Get big data analytic status"""
@@ -387,6 +992,13 @@ class VelocityClient:
         """Get status of all big data analytics"""
         return await self._request("GET", "/iot/analytics/bigdata/status")
     
+    async def get_bigdata_analytic_statuses(self, analytic_ids: List[str]) -> List[Any]:
+        """Get the status of several big data analytics concurrently; failures are returned in place"""
+        return await self.gather_limited(
+            (self.get_bigdata_analytic_status(analytic_id) for analytic_id in analytic_ids),
+            return_exceptions=True
+        )
+    
     async def clone_bigdata_analytic(
         self, 
         analytic_id: str, 
@@ -394,10 +1006,7 @@ class VelocityClient:
         description: Optional[str] = None
     ) -> Dict[str, Any]:
         """Clone a big data analytic"""
-        body = {"name": name}
-        if description:
-            body["description"] = description
-        return await self._request("POST", f"/iot/analytics/bigdata/{analytic_id}/clone", json=body)
+        return await self._clone_item(_BIGDATA_PATH, analytic_id, name, description)
     
     async def scale_bigdata_analytic(
         self, 
@@ -407,20 +1016,15 @@ class VelocityClient:
         instances: int
     ) -> Dict[str, Any]:
         """Scale a running big data analytic"""
-        body = {
-            "cpu": cpu,
-            "memory": memory,
-            "instances": instances
-        }
-        return await self._request("PUT", f"/iot/analytics/bigdata/{analytic_id}/scale", json=body)
+        return await self._scale_item(_BIGDATA_PATH, analytic_id, cpu, memory, instances)
     
     async def validate_bigdata_analytic(self, analytic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a big data analytic configuration"""
-        return await self._request("POST", "/iot/analytics/bigdata/validate", json=analytic_data)
+        return await self._validate_item(_BIGDATA_PATH, analytic_data)
     
     async def validate_bigdata_analytic_by_id(self, analytic_id: str) -> Dict[str, Any]:
         """Validate a big data analytic by ID"""
-        return await self._request("GET", f"/iot/analytics/bigdata/validate/{analytic_id}")
+        return await self._validate_item_by_id(_BIGDATA_PATH, analytic_id)
     
     # ========== Services ==========
     
@@ -430,39 +1034,39 @@ class VelocityClient:
     
     async def get_feature_services(self) -> Dict[str, Any]:
         """Get all feature services"""
-        return await self._request("GET", "/iot/services/feature")
+        return await self._list_items(_FEATURE_SERVICE_PATH)
     
     async def get_feature_service(self, service_id: str) -> Dict[str, Any]:
         """Get a specific feature service"""
-        return await self._request("GET", f"/iot/services/feature/{service_id}")
+        return await self._get_item(_FEATURE_SERVICE_PATH, service_id)
     
     async def create_feature_service(self, service_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new feature service"""
-        return await self._request("POST", "/iot/services/feature", json=service_data)
+        return await self._create_item(_FEATURE_SERVICE_PATH, service_data)
     
     async def update_feature_service(self, service_id: str, service_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a feature service"""
-        return await self._request("PUT", f"/iot/services/feature/{service_id}", json=service_data)
+        return await self._update_item(_FEATURE_SERVICE_PATH, service_id, service_data)
     
     async def delete_feature_service(self, service_id: str) -> Dict[str, Any]:
         """Delete a feature service"""
-        return await self._request("DELETE", f"/iot/services/feature/{service_id}")
+        return await self._delete_item(_FEATURE_SERVICE_PATH, service_id)
     
     async def get_stream_services(self) -> List[Dict[str, Any]]:
         """Get all stream services"""
-        return await self._request("GET", "/iot/services/stream")
+        return await self._list_items(_STREAM_SERVICE_PATH)
     
     async def get_stream_service(self, service_id: str) -> Dict[str, Any]:
         """Get a specific stream service"""
-        return await self._request("GET", f"/iot/services/stream/{service_id}")
+        return await self._get_item(_STREAM_SERVICE_PATH, service_id)
     
     async def update_stream_service(self, service_id: str, service_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a stream service"""
-        return await self._request("PUT", f"/iot/services/stream/{service_id}", json=service_data)
+        return await self._update_item(_STREAM_SERVICE_PATH, service_id, service_data)
     
     async def delete_stream_service(self, service_id: str) -> Dict[str, Any]:
         """Delete a stream service"""
-        return await self._request("DELETE", f"/iot/services/stream/{service_id}")
+        return await self._delete_item(_STREAM_SERVICE_PATH, service_id)
     
     async def get_service_dependencies(self, portal_item_id: str) -> List[Dict[str, Any]]:
         """Get list of items that depend on a portal item"""
@@ -470,50 +1074,53 @@ class VelocityClient:
     
     # ========== Definitions ==========
     
+    # Definition catalogs change rarely, so these are cached for _DEFINITIONS_TTL
+    # and the same objects are handed to every caller until they expire
+    
     async def get_feed_types(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all feed type definitions"""
+        """Get all feed type definitions (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", "/iot/feed/types", params=params)
+        return await self._cached_get("/iot/feed/types", params=params)
     
     async def get_feed_type(self, name: str, locale: Optional[str] = None) -> Dict[str, Any]:
-        """Get a specific feed type definition"""
+        """Get a specific feed type definition (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", f"/iot/feed/type/{name}", params=params)
+        return await self._cached_get(f"/iot/feed/type/{name}", params=params)
     
     async def get_tool_definitions(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all tool definitions"""
+        """Get all tool definitions (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", "/iot/analytics/tools", params=params)
+        return await self._cached_get("/iot/analytics/tools", params=params)
     
     async def get_tool_definition(self, name: str, locale: Optional[str] = None) -> Dict[str, Any]:
-        """Get a specific tool definition"""
+        """Get a specific tool definition (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", f"/iot/analytics/tools/{name}", params=params)
+        return await self._cached_get(f"/iot/analytics/tools/{name}", params=params)
     
     async def get_output_definitions(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all output definitions"""
+        """Get all output definitions (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", "/iot/outputs", params=params)
+        return await self._cached_get("/iot/outputs", params=params)
     
     async def get_output_definition(self, name: str, locale: Optional[str] = None) -> Dict[str, Any]:
-        """Get a specific output definition"""
+        """Get a specific output definition (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", f"/iot/outputs/{name}", params=params)
+        return await self._cached_get(f"/iot/outputs/{name}", params=params)
     
     async def get_source_definitions(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all source definitions"""
+        """Get all source definitions (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", "/iot/sources", params=params)
+        return await self._cached_get("/iot/sources", params=params)
     
     async def get_source_definition(self, name: str, locale: Optional[str] = None) -> Dict[str, Any]:
-        """Get a specific source definition"""
+        """Get a specific source definition (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", f"/iot/sources/{name}", params=params)
+        return await self._cached_get(f"/iot/sources/{name}", params=params)
     
     async def get_format_definitions(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all format definitions"""
+        """Get all format definitions (cached; the result is shared, don't mutate it)"""
         params = {"locale": locale} if locale else None
-        return await self._request("GET", "/iot/formats", params=params)
+        return await self._cached_get("/iot/formats", params=params)
     
     # ========== Logs ==========
     
@@ -533,11 +1140,17 @@ class VelocityClient:
     
     async def import_configuration(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Import configuration from snapshot"""
-        return await self._request("POST", "/iot/configuration/import", json=config_data)
+        try:
+            return await self._request("POST", "/iot/configuration/import", json=config_data)
+        finally:
+            self.invalidate_definitions()
     
     async def reset_configuration(self) -> Dict[str, Any]:
         """Reset site - delete all item configurations"""
-        return await self._request("DELETE", "/iot/configuration/reset")
+        try:
+            return await self._request("DELETE", "/iot/configuration/reset")
+        finally:
+            self.invalidate_definitions()
     
     # ========== Tenant & Metrics ==========
     
@@ -571,5 +1184,5 @@ class VelocityClient:
     # ========== System ==========
     
     async def get_version(self) -> Dict[str, Any]:
-        """Get Velocity API version"""
-        return await self._request("GET", "/iot/api/version")
+        """Get Velocity API version (cached; the result is shared, don't mutate it)"""
+        return await self._cached_get("/iot/api/version", ttl=_VERSION_TTL)
@@ -19,65 +19,84 @@ from arcgis_velocity_mcp import VelocityClient, get_config
 async def test_authentication():
     """Test authentication and basic API access"""
     
-    print("Testing ArcGIS Velocity MCP Server Authentication")
-    print("=" * 50)
+    # Collected and written in batches rather than printed line by line; flushed
+    # before each network step so a slow or hanging call shows where it is
+    lines = []
+    out = lines.append
+    
+    def flush():
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            lines.clear()
+    
+    out("Testing ArcGIS Velocity MCP Server Authentication")
+    out("=" * 50)
     
     try:
         # Load configuration
-        print("\n1. Loading configuration...")
+        out("\n1. Loading configuration...")
         config = get_config()
-        print(f"   ✓ Base URL: {config.base_url}")
-        print(f"   ✓ Username: {config.username}")
-        print(f"   ✓ Portal URL: {config.portal_url}")
+        out(f"   ✓ Base URL: {config.base_url}")
+        out(f"   ✓ Username: {config.username}")
+        out(f"   ✓ Portal URL: {config.portal_url}")
         
         # Create client
-        print("\n2. Creating Velocity client...")
+        out("\n2. Creating Velocity client...")
         async with VelocityClient(
             config.base_url,
             config.username,
             config.password,
             config.portal_url
         ) as client:
-            print("   ✓ Client created successfully")
+            out("   ✓ Client created successfully")
             
             # Test token generation
-            print("\n3. Testing token generation...")
+            out("\n3. Testing token generation...")
+            flush()
             token = await client._ensure_valid_token()
-            print(f"   ✓ Token generated: {token[:20]}...")
-            print(f"   ✓ Token expiry: {client._token_expiry}")
-            
-            # Test API call - get version
-            print("\n4. Testing API call (get version)...")
-            version = await client.get_version()
-            print(f"   ✓ API Version: {version.get('version', 'Unknown')}")
+            out(f"   ✓ Token generated: {token[:20]}...")
+            out(f"   ✓ Token lifetime: {client._token_lifetime:.0f} seconds")
             
-            # Test another API call - list feeds
-            print("\n5. Testing API call (list feeds)...")
-            feeds = await client.get_feeds()
-            print(f"   ✓ Found {len(feeds)} feeds")
+            # Test API calls - get version and list feeds, sent concurrently
+            out("\n4. Testing API calls (get version, list feeds)...")
+            flush()
+            version, feeds = await asyncio.gather(client.get_version(), client.get_feeds())
+            out(f"   ✓ API Version: {version.get('version', 'Unknown')}")
+            out(f"   ✓ Found {len(feeds)} feeds")
             
             if feeds:
-                print(f"   ✓ Sample feed: {feeds[0].get('label', 'Unknown')}")
+                out(f"   ✓ Sample feed: {feeds[0].get('label', 'Unknown')}")
             
-            print("\n" + "=" * 50)
-            print("✓ All tests passed successfully!")
-            print("=" * 50)
+            out("\n" + "=" * 50)
+            out("✓ All tests passed successfully!")
+            out("=" * 50)
             
     except ValueError as e:
-        print(f"\n✗ Configuration Error: {e}")
-        print("\nPlease ensure all required environment variables are set:")
-        print("  - VELOCITY_BASE_URL")
-        print("  - VELOCITY_USERNAME")
-        print("  - VELOCITY_PASSWORD")
-        print("  - VELOCITY_PORTAL_URL")
+        out(f"\n✗ Configuration Error: {e}")
+        out("\nPlease ensure all required environment variables are set:")
+        out("  - VELOCITY_BASE_URL")
+        out("  - VELOCITY_USERNAME")
+        out("  - VELOCITY_PASSWORD")
+        out("  - VELOCITY_PORTAL_URL")
         sys.exit(1)
         
     except Exception as e:
-        print(f"\n✗ Test Failed: {e}")
+        out(f"\n✗ Test Failed: {e}")
+        flush()
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    
+    finally:
+        flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_authentication())
+    # uvloop is optional (pip install -e ".[uvloop]"); fall back to asyncio's loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test_authentication())
+    else:
+        uvloop.run(test_authentication())
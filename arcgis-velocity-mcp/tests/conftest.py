@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the ArcGIS Velocity MCP tests
+"""
+
+import time
+
+import httpx
+import pytest
+
+from arcgis_velocity_mcp import velocity_client
+from arcgis_velocity_mcp.velocity_client import VelocityClient
+
+BASE_URL = "https://velocity.example.com"
+PORTAL_URL = "https://portal.example.com"
+
+
+class FakeVelocity:
+    """
+    Mock transport handler standing in for the portal and the Velocity API.
+
+    Tokens are issued as tok1, tok2, ... Each test sets api() to answer API
+    requests; every API request is recorded in requests.
+    """
+
+    def __init__(self):
+        self.tokens_issued = 0
+        self.requests: list[httpx.Request] = []
+        self.api = lambda request: httpx.Response(200, json={"path": request.url.path})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/generateToken"):
+            self.tokens_issued += 1
+            return httpx.Response(200, json={
+                "token": f"tok{self.tokens_issued}",
+                "expires": int((time.time() + 3600) * 1000)
+            })
+        self.requests.append(request)
+        return self.api(request)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    """Retry immediately so backoff doesn't slow the tests down"""
+    monkeypatch.setattr(velocity_client, "_RETRY_BASE_DELAY", 0.0)
+
+
+@pytest.fixture
+def fake() -> FakeVelocity:
+    return FakeVelocity()
+
+
+@pytest.fixture
+async def client(fake):
+    """A VelocityClient talking to the fake, without the background refresher"""
+    velocity = VelocityClient(BASE_URL, "user", "secret", PORTAL_URL)
+    velocity.client = httpx.AsyncClient(transport=httpx.MockTransport(fake), base_url=BASE_URL)
+    yield velocity
+    await velocity.client.aclose()
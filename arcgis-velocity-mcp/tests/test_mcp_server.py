@@ -0,0 +1,89 @@
+"""
+Tests for the MCP tool layer: input validation and request coalescing
+"""
+
+import asyncio
+
+import mcp.types as types
+import pytest
+
+from arcgis_velocity_mcp import mcp_server
+
+
+class CountingClient:
+    """Stands in for VelocityClient, counting status calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_feed_status(self, feed_id):
+        self.calls.append(feed_id)
+        await asyncio.sleep(0.01)
+        if feed_id == "boom":
+            raise RuntimeError("boom")
+        return {"id": feed_id}
+
+
+@pytest.fixture
+def velocity(monkeypatch):
+    client = CountingClient()
+    monkeypatch.setattr(mcp_server, "_client", client)
+    return client
+
+
+async def call(name, arguments):
+    """Call a tool through the MCP request handler, as a session would"""
+    handler = mcp_server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    return (await handler(request)).root
+
+
+async def test_invalid_input_is_an_error_result(velocity):
+    result = await call("get_feed", {})
+    assert result.isError
+    assert result.content[0].text == "Input validation error: 'feed_id' is a required property"
+
+
+async def test_missing_client_reports_the_configuration_error(monkeypatch):
+    monkeypatch.setattr(mcp_server, "_client", None)
+    monkeypatch.setattr(mcp_server, "_client_error", "VELOCITY_BASE_URL environment variable is required")
+    result = await call("get_feeds", {})
+    assert result.content[0].text == "Error: VELOCITY_BASE_URL environment variable is required"
+
+
+async def test_identical_concurrent_calls_share_one_request(velocity):
+    results = await asyncio.gather(*(
+        call("get_feed_status", {"feed_id": "f1"}) for _ in range(5)
+    ))
+    assert velocity.calls == ["f1"]
+    assert all(not result.isError for result in results)
+    assert mcp_server._in_flight == {}
+
+
+async def test_different_arguments_are_not_coalesced(velocity):
+    await asyncio.gather(
+        call("get_feed_status", {"feed_id": "f1"}),
+        call("get_feed_status", {"feed_id": "f2"}),
+    )
+    assert sorted(velocity.calls) == ["f1", "f2"]
+
+
+async def test_unhashable_extra_arguments_are_ignored(velocity):
+    result = await call("get_feed_status", {"feed_id": "f1", "extra": {"x": 1}})
+    assert not result.isError
+    assert velocity.calls == ["f1"]
+
+
+async def test_cancelled_callers_leave_no_unretrieved_exception(velocity):
+    handler = mcp_server._DISPATCH["get_feed_status"]
+    task = asyncio.ensure_future(handler(velocity, {"feed_id": "boom"}))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0.05)
+
+    # The shared call ran to completion and its exception was marked as seen
+    assert velocity.calls == ["boom"]
+    assert mcp_server._in_flight == {}
@@ -0,0 +1,254 @@
+"""
+Tests for VelocityClient: retries, token replacement, circuit breaking,
+shared HTTP clients and argument validation
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from arcgis_velocity_mcp.velocity_client import (
+    CircuitOpenError,
+    VelocityClient,
+    _CircuitBreaker,
+    _RETRY_MAX_ATTEMPTS,
+)
+
+from .conftest import BASE_URL, PORTAL_URL
+
+
+def fail_times(times: int, status: int):
+    """API handler that answers status for the first times requests, then 200"""
+    calls = {"n": 0}
+
+    def api(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] <= times:
+            return httpx.Response(status)
+        return httpx.Response(200, json={"ok": True})
+
+    return api
+
+
+# ========== Retries ==========
+
+async def test_get_retries_gateway_errors(client, fake):
+    fake.api = fail_times(2, 503)
+    assert await client.get_feed("f1") == {"ok": True}
+    assert len(fake.requests) == 3
+
+
+async def test_get_gives_up_after_max_attempts(client, fake):
+    fake.api = fail_times(99, 503)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_feed("f1")
+    assert len(fake.requests) == _RETRY_MAX_ATTEMPTS
+
+
+async def test_plain_500_is_not_retried(client, fake):
+    fake.api = fail_times(1, 500)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_feed("f1")
+    assert len(fake.requests) == 1
+
+
+async def test_create_post_is_not_retried(client, fake):
+    fake.api = fail_times(1, 503)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.create_feed({"label": "x"})
+    assert len(fake.requests) == 1
+
+
+async def test_read_only_post_is_retried(client, fake):
+    fake.api = fail_times(1, 503)
+    assert await client.validate_feed({"label": "x"}) == {"ok": True}
+    assert len(fake.requests) == 2
+
+
+async def test_429_is_retried_for_any_method(client, fake):
+    fake.api = fail_times(1, 429)
+    assert await client.create_feed({"label": "x"}) == {"ok": True}
+    assert len(fake.requests) == 2
+
+
+async def test_connect_error_is_retried_for_any_method(client, fake):
+    calls = {"n": 0}
+
+    def api(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    fake.api = api
+    assert await client.create_feed({"label": "x"}) == {"ok": True}
+    assert calls["n"] == 2
+
+
+# ========== Token Replacement ==========
+
+async def test_401_replaces_token_and_resends(client, fake):
+    fake.api = lambda request: (
+        httpx.Response(401) if request.headers["Authorization"] == "Bearer tok1"
+        else httpx.Response(200, json={"ok": True})
+    )
+    assert await client.get_feed("f1") == {"ok": True}
+    assert [r.headers["Authorization"] for r in fake.requests] == ["Bearer tok1", "Bearer tok2"]
+    assert fake.tokens_issued == 2
+
+
+async def test_concurrent_401s_share_one_replacement_token(client, fake):
+    async def api(request):
+        await asyncio.sleep(0.01)
+        if request.headers["Authorization"] == "Bearer tok1":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    fake.api = api
+    results = await asyncio.gather(*(client.get_feed(f"f{i}") for i in range(10)))
+    assert results == [{"ok": True}] * 10
+    assert fake.tokens_issued == 2
+
+
+async def test_empty_response_is_reported_as_success(client, fake):
+    fake.api = lambda request: httpx.Response(204)
+    assert await client.start_feed("f1") == {"success": True}
+
+
+# ========== Circuit Breaker ==========
+
+async def test_breaker_opens_half_opens_and_closes():
+    breaker = _CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    # After the cooldown one probe is let through; a failed probe reopens
+    await asyncio.sleep(0.06)
+    breaker.check()
+    assert breaker.state == breaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+
+    # A successful probe closes it again
+    await asyncio.sleep(0.06)
+    breaker.check()
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+    assert breaker.failures == 0
+
+
+async def test_retried_request_counts_once_against_breaker(client, fake):
+    fake.api = fail_times(99, 503)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_feed("f1")
+    assert client._api_circuit.failures == 1
+    assert client._api_circuit.state == _CircuitBreaker.CLOSED
+
+
+async def test_breaker_ignores_plain_500(client, fake):
+    fake.api = lambda request: httpx.Response(500)
+    for _ in range(10):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_feed("f1")
+    assert client._api_circuit.state == _CircuitBreaker.CLOSED
+
+
+async def test_open_breaker_fails_fast(client, fake):
+    fake.api = fail_times(99, 503)
+    for _ in range(client._api_circuit.failure_threshold):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_feed("f1")
+    sent = len(fake.requests)
+    with pytest.raises(CircuitOpenError):
+        await client.get_feed("f1")
+    assert len(fake.requests) == sent
+
+
+# ========== Shared HTTP Clients ==========
+
+@pytest.fixture
+def shared_pool():
+    """Isolate the class-level shared client pool"""
+    VelocityClient._shared_clients.clear()
+    VelocityClient._shared_refcounts.clear()
+    yield VelocityClient
+    VelocityClient._shared_clients.clear()
+    VelocityClient._shared_refcounts.clear()
+
+
+def make_shared() -> VelocityClient:
+    return VelocityClient(BASE_URL, "user", "secret", PORTAL_URL, share_client=True)
+
+
+async def test_unentered_shared_client_holds_no_reference(shared_pool):
+    make_shared()
+    assert shared_pool._shared_clients == {}
+    assert shared_pool._shared_refcounts == {}
+
+
+async def test_shared_client_closes_after_last_exit(shared_pool):
+    first, second = make_shared(), make_shared()
+    async with first:
+        async with second:
+            assert first.client is second.client
+            http = first.client
+            assert shared_pool._shared_refcounts[http] == 2
+        assert not http.is_closed
+        assert shared_pool._shared_refcounts[http] == 1
+    assert http.is_closed
+    assert shared_pool._shared_clients == {}
+    assert shared_pool._shared_refcounts == {}
+
+
+async def test_replacing_a_closed_shared_client_keeps_old_holders_apart(shared_pool):
+    old_holder = make_shared()
+    async with old_holder:
+        old = old_holder.client
+        await old.aclose()
+        newcomer = make_shared()
+        async with newcomer:
+            new = newcomer.client
+            assert new is not old
+            assert shared_pool._shared_refcounts == {old: 1, new: 1}
+        # The newcomer's exit closes only the client it took
+        assert new.is_closed
+        assert shared_pool._shared_refcounts == {old: 1}
+    assert shared_pool._shared_refcounts == {}
+
+
+# ========== Resource Methods ==========
+
+async def test_resource_methods_accept_keyword_arguments(client, fake):
+    await client.update_feed(feed_id="f1", feed_data={"label": "x"})
+    await client.clone_realtime_analytic(analytic_id="a1", name="copy")
+    await client.delete_stream_service(service_id="s1")
+    assert [(r.method, r.url.path) for r in fake.requests] == [
+        ("PUT", "/iot/feed/f1"),
+        ("POST", "/iot/analytics/realtime/a1/clone"),
+        ("DELETE", "/iot/services/stream/s1"),
+    ]
+
+
+async def test_metrics_without_interval_sends_no_body(client, fake):
+    await client.get_feed_metrics("f1")
+    await client.get_feed_metrics("f1", time_interval="1h")
+    assert fake.requests[0].content == b""
+    assert fake.requests[1].content == b'{"timeInterval":"1h"}'
+
+
+# ========== Construction ==========
+
+@pytest.mark.parametrize("kwargs", [
+    {"max_concurrency": 0},
+    {"rps": 0},
+    {"rps": -1.0},
+    {"burst": 0},
+])
+def test_rejects_non_positive_limits(kwargs):
+    with pytest.raises(ValueError):
+        VelocityClient(BASE_URL, "user", "secret", PORTAL_URL, **kwargs)